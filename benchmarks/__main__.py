@@ -0,0 +1,114 @@
+import os
+import sys
+import logging
+import argparse
+import tempfile
+
+from . import results as bench_results
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks',
+                                     description='Benchmark the Smart Power Manager control loop with simulated sources.')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help='run the benchmark suite')
+    run_parser.add_argument('--quick', action='store_true', help='fewer iterations and smaller inputs')
+    run_parser.add_argument('--only', action='append', metavar='NAME', help='run only this benchmark (repeatable)')
+    run_parser.add_argument('--output', metavar='PATH', help='write results JSON to PATH')
+    run_parser.add_argument('--save-baseline', metavar='NAME', help='write results to benchmarks/baselines/NAME.json')
+    run_parser.add_argument('--compare', metavar='BASELINE', help='compare results against a baseline name or path')
+    run_parser.add_argument('--threshold', type=float, default=10.0, help='regression threshold in percent (default: 10)')
+    run_parser.add_argument('--verbose', action='store_true', help='keep application logging enabled')
+
+    compare_parser = subparsers.add_parser('compare', help='compare two result files')
+    compare_parser.add_argument('baseline', help='baseline name or path')
+    compare_parser.add_argument('current', help='current results name or path')
+    compare_parser.add_argument('--threshold', type=float, default=10.0, help='regression threshold in percent (default: 10)')
+
+    return parser.parse_args(argv)
+
+
+def missing_report(path, kind):
+    if os.path.exists(path):
+        return False
+    if kind == 'baseline':
+        print(f"Baseline not found: {path}")
+        print("Create it with: python -m benchmarks run --save-baseline <name>")
+    else:
+        print(f"Results file not found: {path}")
+    return True
+
+
+def compare(baseline_name, current_report, threshold):
+    baseline_file = bench_results.baseline_path(baseline_name)
+    if missing_report(baseline_file, 'baseline'):
+        return 2
+    baseline = bench_results.load_report(baseline_file)
+    rows = bench_results.compare_reports(baseline, current_report, threshold)
+    bench_results.print_comparison(rows, baseline, current_report, threshold)
+    regressions = [row for row in rows if row[4] == 'REGRESSION']
+    if regressions:
+        print(f"{len(regressions)} regression(s) above {threshold:g}%")
+        return 1
+    return 0
+
+
+def run(args):
+    output_paths = []
+    if args.output:
+        output_paths.append(os.path.abspath(args.output))
+    if args.save_baseline:
+        output_paths.append(os.path.abspath(bench_results.baseline_path(args.save_baseline)))
+    compare_path = os.path.abspath(bench_results.baseline_path(args.compare)) if args.compare else None
+    if compare_path and missing_report(compare_path, 'baseline'):
+        return 2
+
+    if not args.verbose:
+        logging.disable(logging.CRITICAL)
+
+    if REPO_ROOT not in sys.path:
+        sys.path.insert(0, REPO_ROOT)
+
+    original_cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix='spm-bench-') as workdir:
+        # The application writes its log files relative to the working directory
+        os.chdir(workdir)
+        os.makedirs('logs', exist_ok=True)
+        try:
+            from . import suite
+            unknown = set(args.only or []) - set(suite.BENCHMARKS)
+            if unknown:
+                print(f"Unknown benchmark(s): {', '.join(sorted(unknown))}. Available: {', '.join(suite.BENCHMARKS)}")
+                return 2
+            results = suite.run_benchmarks(args.only, quick=args.quick)
+        finally:
+            os.chdir(original_cwd)
+
+    report = bench_results.build_report(results, args.quick)
+    bench_results.print_report(report)
+    for path in output_paths:
+        bench_results.save_report(report, path)
+        print(f"Results written to {path}")
+
+    if compare_path:
+        print()
+        return compare(compare_path, report, args.threshold)
+    return 0
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.command == 'run':
+        return run(args)
+    current_file = bench_results.baseline_path(args.current)
+    if missing_report(current_file, 'results'):
+        return 2
+    current = bench_results.load_report(current_file)
+    return compare(args.baseline, current, args.threshold)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
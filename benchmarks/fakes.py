@@ -0,0 +1,213 @@
+import sys
+import types
+import random
+import collections
+
+WS_VISIBLE = 0x10000000
+GWL_STYLE = -16
+POWER_TIME_UNLIMITED = -2
+
+PLAN_GUIDS = {
+    'high_performance': '8c5e7fda-e8bf-4a96-9a85-a6e23a8c635c',
+    'balanced': '381b4222-f694-41f0-9685-ff5bb260df2e',
+    'power_saver': 'a1841308-3541-4fab-bc81-f71556f20b4a',
+    'turbo': 'e9a42b02-d5df-448d-aa00-03f14749eb61',
+}
+
+APP_NAMES = ['code.exe', 'msedge.exe', 'explorer.exe', 'notepad.exe', 'slack.exe',
+             'spotify.exe', 'chrome.exe', 'teams.exe', 'outlook.exe', 'cs2.exe']
+BACKGROUND_NAMES = ['svchost.exe', 'runtimebroker.exe', 'searchhost.exe', 'dllhost.exe',
+                    'conhost.exe', 'ctfmon.exe', 'audiodg.exe', 'updatehelper.exe']
+
+sbattery = collections.namedtuple('sbattery', ['percent', 'secsleft', 'power_plugged'])
+
+
+class SimulatedClock:
+    def __init__(self, start=1_700_000_000.0):
+        self.now = start
+        self.on_sleep = None
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+        if self.on_sleep:
+            self.on_sleep(seconds)
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+class FakeProcess:
+    __slots__ = ('info',)
+
+    def __init__(self, name, pid):
+        self.info = {'name': name, 'pid': pid}
+
+
+class FakeWindow:
+    __slots__ = ('hwnd', 'pid', 'title', 'rect', 'style')
+
+    def __init__(self, hwnd, pid, title, rect, style=WS_VISIBLE):
+        self.hwnd = hwnd
+        self.pid = pid
+        self.title = title
+        self.rect = rect
+        self.style = style
+
+
+class SimulatedWorld:
+    def __init__(self, process_count=150, window_count=20, seed=1234):
+        self.random = random.Random(seed)
+        self.processes = []
+        self.windows = {}
+        self.battery = None
+        self._next_pid = 1000
+        self._next_hwnd = 0x10000
+        self.populate(process_count, window_count)
+
+    def populate(self, process_count, window_count):
+        self.processes = []
+        self.windows = {}
+        for index in range(process_count):
+            if index < window_count:
+                name = APP_NAMES[index % len(APP_NAMES)]
+            else:
+                name = BACKGROUND_NAMES[index % len(BACKGROUND_NAMES)] if index % 3 else f"worker{index}.exe"
+            self.processes.append(FakeProcess(name, self._allocate_pid()))
+
+        for process in self.processes[:window_count]:
+            self._add_window(process.info['pid'], process.info['name'])
+
+    def _allocate_pid(self):
+        self._next_pid += 4
+        return self._next_pid
+
+    def _add_window(self, pid, title):
+        self._next_hwnd += 2
+        hwnd = self._next_hwnd
+        self.windows[hwnd] = FakeWindow(hwnd, pid, title, (0, 0, 1280, 720))
+
+    def launch(self, name):
+        pid = self._allocate_pid()
+        self.processes.append(FakeProcess(name, pid))
+        self._add_window(pid, name)
+
+    def churn(self, count=3):
+        for _ in range(count):
+            index = self.random.randrange(len(self.processes))
+            old = self.processes[index]
+            new = FakeProcess(old.info['name'], self._allocate_pid())
+            self.processes[index] = new
+            for hwnd, window in list(self.windows.items()):
+                if window.pid == old.info['pid']:
+                    del self.windows[hwnd]
+                    self._add_window(new.info['pid'], window.title)
+
+    def set_battery(self, percent, power_plugged, secsleft=POWER_TIME_UNLIMITED):
+        self.battery = sbattery(percent, secsleft, power_plugged)
+
+
+class _FakeListener:
+    def __init__(self, **callbacks):
+        self.callbacks = callbacks
+        self.daemon = False
+        self.running = False
+
+    def start(self):
+        self.running = True
+
+    def stop(self):
+        self.running = False
+
+
+_active = {'world': None}
+
+
+def world():
+    return _active['world']
+
+
+def _build_modules():
+    psutil = types.ModuleType('psutil')
+    psutil.POWER_TIME_UNLIMITED = POWER_TIME_UNLIMITED
+    psutil.POWER_TIME_UNKNOWN = -1
+    psutil.NoSuchProcess = type('NoSuchProcess', (Exception,), {})
+    psutil.AccessDenied = type('AccessDenied', (Exception,), {})
+    psutil.ZombieProcess = type('ZombieProcess', (psutil.NoSuchProcess,), {})
+    psutil.process_iter = lambda attrs=None: iter(world().processes)
+    psutil.sensors_battery = lambda: world().battery
+
+    win32gui = types.ModuleType('win32gui')
+
+    def enum_windows(callback, extra):
+        for hwnd in list(world().windows):
+            if callback(hwnd, extra) is False:
+                break
+
+    win32gui.EnumWindows = enum_windows
+    win32gui.IsWindowVisible = lambda hwnd: hwnd in world().windows
+    win32gui.GetWindowText = lambda hwnd: world().windows[hwnd].title
+    win32gui.GetWindowLong = lambda hwnd, index: world().windows[hwnd].style
+    win32gui.GetWindowRect = lambda hwnd: world().windows[hwnd].rect
+
+    win32process = types.ModuleType('win32process')
+    win32process.GetWindowThreadProcessId = lambda hwnd: (hwnd + 1, world().windows[hwnd].pid)
+
+    win32con = types.ModuleType('win32con')
+    win32con.GWL_STYLE = GWL_STYLE
+    win32con.WS_VISIBLE = WS_VISIBLE
+
+    pynput = types.ModuleType('pynput')
+    pynput.mouse = types.ModuleType('pynput.mouse')
+    pynput.keyboard = types.ModuleType('pynput.keyboard')
+    pynput.mouse.Listener = _FakeListener
+    pynput.keyboard.Listener = _FakeListener
+
+    return {
+        'psutil': psutil,
+        'win32gui': win32gui,
+        'win32process': win32process,
+        'win32con': win32con,
+        'pynput': pynput,
+        'pynput.mouse': pynput.mouse,
+        'pynput.keyboard': pynput.keyboard,
+    }
+
+
+def install(initial_world=None):
+    _active['world'] = initial_world or SimulatedWorld()
+    sys.modules.update(_build_modules())
+
+
+def use_world(simulated_world):
+    _active['world'] = simulated_world
+    return simulated_world
+
+
+def use_clock(clock, modules):
+    for module in modules:
+        module.time = clock
+
+
+def make_power_manager_class(base):
+    class FakePowerManager(base):
+        def __init__(self, *args, **kwargs):
+            self.active_guid = PLAN_GUIDS['balanced']
+            self.powercfg_calls = 0
+            super().__init__(*args, **kwargs)
+
+        def _is_admin(self):
+            return True
+
+        def _run_powercfg(self, args):
+            self.powercfg_calls += 1
+            if args[0] == "/getactivescheme":
+                return f"Power Scheme GUID: {self.active_guid}  (Simulated)"
+            if args[0] == "/setactive":
+                self.active_guid = args[1]
+                return ""
+            return None
+
+    return FakePowerManager
@@ -0,0 +1,85 @@
+import os
+import sys
+import json
+import platform
+import datetime
+
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines')
+# Absolute differences below these are treated as noise whatever the percentage
+NOISE_FLOOR = {'bytes': 16 * 1024, 's': 0.001, 'ms': 0.05, 'us': 0.5, 'ns': 10, 'calls': 0.01}
+
+
+def build_report(results, quick):
+    return {
+        'meta': {
+            'created': datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'quick': quick,
+        },
+        'results': {name: {'value': value, 'unit': unit} for name, (value, unit) in sorted(results.items())},
+    }
+
+
+def save_report(report, path):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def load_report(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def baseline_path(name):
+    if name.endswith('.json') or os.sep in name:
+        return name
+    return os.path.join(BASELINE_DIR, f"{name}.json")
+
+
+def compare_reports(baseline, current, threshold_percent):
+    rows = []
+    base_results = baseline['results']
+    for name, entry in sorted(current['results'].items()):
+        if name not in base_results:
+            rows.append((name, None, entry['value'], None, 'new'))
+            continue
+        base_value = base_results[name]['value']
+        value = entry['value']
+        delta = value - base_value
+        if base_value == 0:
+            change = 0.0 if delta == 0 else float('inf') if delta > 0 else float('-inf')
+        else:
+            change = delta / abs(base_value) * 100
+        if abs(delta) <= NOISE_FLOOR.get(entry['unit'], 0):
+            status = 'ok'
+        elif change > threshold_percent:
+            status = 'REGRESSION'
+        elif change < -threshold_percent:
+            status = 'improved'
+        else:
+            status = 'ok'
+        rows.append((name, base_value, value, change, status))
+    for name in sorted(set(base_results) - set(current['results'])):
+        rows.append((name, base_results[name]['value'], None, None, 'missing'))
+    return rows
+
+
+def print_comparison(rows, baseline, current, threshold_percent, out=sys.stdout):
+    if baseline['meta'].get('quick') != current['meta'].get('quick'):
+        out.write("warning: comparing quick and full runs; results are not directly comparable\n")
+    out.write(f"{'benchmark':<36} {'baseline':>14} {'current':>14} {'change':>9}  status (threshold {threshold_percent:g}%)\n")
+    for name, base_value, value, change, status in rows:
+        base_text = f"{base_value:.2f}" if base_value is not None else "-"
+        value_text = f"{value:.2f}" if value is not None else "-"
+        change_text = f"{change:+.1f}%" if change is not None else "-"
+        out.write(f"{name:<36} {base_text:>14} {value_text:>14} {change_text:>9}  {status}\n")
+
+
+def print_report(report, out=sys.stdout):
+    for name, entry in report['results'].items():
+        out.write(f"{name:<36} {entry['value']:>14.2f} {entry['unit']}\n")
@@ -0,0 +1,269 @@
+import gc
+import os
+import time
+import signal
+import statistics
+import tracemalloc
+import configparser
+
+from . import fakes
+
+fakes.install()
+
+import core.controller
+import core.process_monitor
+import core.activity_monitor
+import core.power_manager_windows
+import core.power_source_monitor
+from core.controller import PowerController
+from core.process_monitor import ProcessMonitor
+from core.activity_monitor import ActivityMonitor
+
+SETTINGS_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'config', 'settings.ini')
+CLOCK_MODULES = [core.controller, core.process_monitor, core.activity_monitor,
+                 core.power_manager_windows, core.power_source_monitor]
+FakePowerManager = fakes.make_power_manager_class(core.power_manager_windows.PowerManagerWindows)
+core.controller.PowerManagerWindows = FakePowerManager
+
+SCAN_SIZES = [(100, 10), (200, 20), (400, 40), (800, 80)]
+QUICK_SCAN_SIZES = [(100, 10), (400, 40)]
+
+
+def make_settings():
+    settings = configparser.ConfigParser()
+    with open(SETTINGS_FILE, 'r', encoding='utf-8') as f:
+        settings.read_file(f)
+    settings['PowerPlans'] = {
+        'high_performance_guid': fakes.PLAN_GUIDS['high_performance'],
+        'balanced_guid': fakes.PLAN_GUIDS['balanced'],
+        'power_saver_guid': fakes.PLAN_GUIDS['power_saver'],
+        'turbo_guid': fakes.PLAN_GUIDS['turbo'],
+    }
+    settings['General']['check_interval_seconds'] = '10'
+    if not settings.has_section('Diagnostics'):
+        settings.add_section('Diagnostics')
+    settings['Diagnostics']['enable_tracemalloc'] = '0'
+    return settings
+
+
+def new_clock():
+    clock = fakes.SimulatedClock()
+    fakes.use_clock(clock, CLOCK_MODULES)
+    return clock
+
+
+def measure(func, number, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        timings.append((time.perf_counter() - start) / number)
+    return statistics.median(timings)
+
+
+def run_controller(controller, clock, ticks, on_tick=None):
+    tick_times = []
+
+    def on_sleep(seconds):
+        if seconds != controller.check_interval:
+            return
+        tick_times.append(time.perf_counter())
+        if on_tick:
+            on_tick()
+        if len(tick_times) >= ticks:
+            controller.running = False
+
+    previous_handlers = (signal.getsignal(signal.SIGINT), signal.getsignal(signal.SIGTERM))
+    clock.on_sleep = on_sleep
+    try:
+        controller.run()
+    finally:
+        clock.on_sleep = None
+        signal.signal(signal.SIGINT, previous_handlers[0])
+        signal.signal(signal.SIGTERM, previous_handlers[1])
+    return tick_times
+
+
+def bench_control_loop_tick(quick):
+    world = fakes.use_world(fakes.SimulatedWorld(150, 20))
+    world.set_battery(55, False, 5400)
+    clock = new_clock()
+    controller = PowerController(make_settings())
+
+    tick_times = run_controller(controller, clock, 30 if quick else 200)
+    intervals = [b - a for a, b in zip(tick_times, tick_times[1:])]
+    return {
+        'control_loop_tick_us': (statistics.median(intervals) * 1e6, 'us'),
+    }
+
+
+def bench_process_scan(quick):
+    results = {}
+    settings = make_settings()
+    heavy = [p.strip() for p in settings.get('Processes', 'heavy_processes').split(',') if p.strip()]
+    for process_count, window_count in (QUICK_SCAN_SIZES if quick else SCAN_SIZES):
+        fakes.use_world(fakes.SimulatedWorld(process_count, window_count))
+        clock = new_clock()
+        monitor = ProcessMonitor(heavy, turbo_config=settings)
+
+        def full_scan():
+            clock.advance(monitor._cache_lifetime + 1)
+            monitor.get_active_processes_with_windows()
+
+        seconds = measure(full_scan, 3 if quick else 10, 3 if quick else 5)
+        results[f'process_scan_p{process_count}_w{window_count}_us'] = (seconds * 1e6, 'us')
+
+    results['process_scan_cached_us'] = (measure(monitor.get_active_processes_with_windows, 1000, 5) * 1e6, 'us')
+    return results
+
+
+def bench_power_switch(quick):
+    # The fixed settle sleep in set_power_plan runs on the simulated clock, so only CPU cost is measured
+    new_clock()
+    manager = FakePowerManager(fakes.PLAN_GUIDS['high_performance'], fakes.PLAN_GUIDS['balanced'],
+                               fakes.PLAN_GUIDS['power_saver'], fakes.PLAN_GUIDS['turbo'])
+    plans = ['high_performance', 'balanced']
+    switches = 50 if quick else 500
+    manager.powercfg_calls = 0
+    start = time.perf_counter()
+    for index in range(switches):
+        manager.set_power_plan(plans[index % 2])
+    elapsed = time.perf_counter() - start
+    return {
+        'power_switch_cpu_us': (elapsed / switches * 1e6, 'us'),
+        'power_switch_powercfg_calls': (manager.powercfg_calls / switches, 'calls'),
+    }
+
+
+def measure_switch_latency(setup, trigger, expected_plan, trials, warmup_ticks=3):
+    """Simulated seconds from a trigger to the matching set_power_plan returning."""
+    latencies = []
+    for trial in range(trials):
+        world = fakes.use_world(fakes.SimulatedWorld(150, 0))
+        setup(world)
+        clock = new_clock()
+        controller = PowerController(make_settings())
+        interval = controller.check_interval
+        # Spread triggers across tick phases and across the power source sampling window
+        span_ticks = max(1, controller.power_source_monitor.ac_sample_interval // interval)
+        trigger_tick = warmup_ticks + trial * span_ticks // trials
+        trigger_offset = interval * (trial + 0.5) / trials
+        state = {'ticks': 0, 'trigger_time': None, 'switch_time': None}
+
+        manager = controller.power_manager
+        set_power_plan = manager.set_power_plan
+
+        def recording_set_power_plan(plan_name):
+            result = set_power_plan(plan_name)
+            if state['trigger_time'] is not None and state['switch_time'] is None and plan_name == expected_plan:
+                state['switch_time'] = clock.time()
+            return result
+
+        manager.set_power_plan = recording_set_power_plan
+
+        def on_tick():
+            state['ticks'] += 1
+            controller.activity_monitor._on_key_press(None)
+            if state['ticks'] == trigger_tick:
+                # The world changes part-way through the sleep that just elapsed
+                state['trigger_time'] = clock.time() - interval + trigger_offset
+                trigger(world)
+            if state['switch_time'] is not None:
+                controller.running = False
+
+        run_controller(controller, clock, trigger_tick + 60, on_tick=on_tick)
+        if state['switch_time'] is None:
+            raise RuntimeError(f"Controller never switched to {expected_plan} after the trigger")
+        latencies.append(state['switch_time'] - state['trigger_time'])
+    return latencies
+
+
+def bench_switch_latency(quick):
+    trials = 4 if quick else 12
+
+    def on_ac(world):
+        world.set_battery(80, True)
+
+    def turbo_on_ac(world):
+        world.launch('cs2.exe')
+        world.set_battery(80, True)
+
+    turbo_app = measure_switch_latency(on_ac, lambda world: world.launch('cs2.exe'), 'turbo', trials)
+    unplugged = measure_switch_latency(turbo_on_ac, lambda world: world.set_battery(80, False),
+                                       'high_performance', trials)
+    return {
+        'switch_latency_turbo_app_mean_s': (statistics.mean(turbo_app), 's'),
+        'switch_latency_turbo_app_max_s': (max(turbo_app), 's'),
+        'switch_latency_unplug_mean_s': (statistics.mean(unplugged), 's'),
+        'switch_latency_unplug_max_s': (max(unplugged), 's'),
+    }
+
+
+def bench_input_callbacks(quick):
+    new_clock()
+    monitor = ActivityMonitor(300)
+    number = 2000 if quick else 20000
+    positions = iter(range(10**9))
+
+    def far_move():
+        offset = next(positions) % 2 * 100
+        monitor._on_mouse_move(offset, offset)
+
+    def near_move():
+        monitor._on_mouse_move(next(positions) % 2, 0)
+
+    return {
+        'input_mouse_move_ns': (measure(far_move, number, 5) * 1e9, 'ns'),
+        'input_mouse_jitter_ns': (measure(near_move, number, 5) * 1e9, 'ns'),
+        'input_key_press_ns': (measure(lambda: monitor._on_key_press(None), number, 5) * 1e9, 'ns'),
+    }
+
+
+def bench_memory_per_hour(quick):
+    world = fakes.use_world(fakes.SimulatedWorld(150, 20))
+    world.set_battery(80, True)
+    clock = new_clock()
+    controller = PowerController(make_settings())
+    ticks_per_hour = 3600 // controller.check_interval
+    hours = 0.25 if quick else 1
+
+    run_controller(controller, clock, ticks_per_hour // 4, on_tick=world.churn)
+
+    # Growth is the slope between two consecutive periods, so one-off table resizes
+    # during the first period are not reported as a per-hour leak
+    gc.collect()
+    tracemalloc.start()
+    try:
+        run_controller(controller, clock, int(ticks_per_hour * hours), on_tick=world.churn)
+        gc.collect()
+        first_period, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        run_controller(controller, clock, int(ticks_per_hour * hours), on_tick=world.churn)
+        gc.collect()
+        second_period, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        'memory_growth_bytes_per_hour': ((second_period - first_period) / hours, 'bytes'),
+        'memory_peak_bytes': (peak, 'bytes'),
+    }
+
+
+BENCHMARKS = {
+    'control_loop_tick': bench_control_loop_tick,
+    'process_scan': bench_process_scan,
+    'power_switch': bench_power_switch,
+    'switch_latency': bench_switch_latency,
+    'input_callbacks': bench_input_callbacks,
+    'memory_per_hour': bench_memory_per_hour,
+}
+
+
+def run_benchmarks(names=None, quick=False):
+    results = {}
+    for name, bench in BENCHMARKS.items():
+        if names and name not in names:
+            continue
+        results.update(bench(quick))
+    return results
@@ -7,6 +7,8 @@ import os
 from .activity_monitor import ActivityMonitor
 from .process_monitor import ProcessMonitor
 from .power_manager_windows import PowerManagerWindows
+from .power_source_monitor import PowerSourceMonitor
+from utils.memory_diagnostics import MemoryDiagnostics
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +23,20 @@ class PowerController:
         self.process_monitor = ProcessMonitor(heavy_processes, turbo_config=settings)
         self.activity_monitor = ActivityMonitor(self.idle_threshold)
 
+        if settings.getboolean('PowerSource', 'enable_battery_policy', fallback=True):
+            self.power_source_monitor = PowerSourceMonitor(settings)
+        else:
+            self.power_source_monitor = None
+
+        if settings.getboolean('Diagnostics', 'enable_tracemalloc', fallback=False):
+            self.memory_diagnostics = MemoryDiagnostics(
+                interval_seconds=settings.getint('Diagnostics', 'snapshot_interval_seconds', fallback=600),
+                top_n=settings.getint('Diagnostics', 'top_allocations', fallback=10),
+                frames=settings.getint('Diagnostics', 'traceback_frames', fallback=1),
+            )
+        else:
+            self.memory_diagnostics = None
+
         try:
             high_perf_guid = settings.get('PowerPlans', 'high_performance_guid')
             balanced_guid = settings.get('PowerPlans', 'balanced_guid')
@@ -92,6 +108,9 @@ class PowerController:
         self.write_to_activity_log(f"Idle threshold: {self.idle_threshold}s\n")
         
         logger.info("Smart Power Manager is running. Press Ctrl+C to stop.")
+
+        if self.memory_diagnostics:
+            self.memory_diagnostics.start()
         
         start_time = time.time()
         
@@ -118,6 +137,15 @@ class PowerController:
                     else:
                         desired_plan = 'balanced'
                         status_msg = "Normal usage → Balanced Mode"
+
+                    power_source = "n/a"
+                    if self.power_source_monitor:
+                        power_state = self.power_source_monitor.get_state()
+                        power_source = power_state.describe()
+                        capped_plan, cap_reason = self.power_source_monitor.apply_policy(desired_plan, power_state)
+                        if capped_plan != desired_plan:
+                            status_msg = f"{status_msg} → capped to {capped_plan} ({cap_reason})"
+                            desired_plan = capped_plan
                     
                     if desired_plan != self.last_power_plan:
                         logger.info(status_msg)
@@ -132,8 +160,11 @@ class PowerController:
                                 break
                     
                     current_time = datetime.datetime.now().strftime('%H:%M:%S')
-                    log_msg = f"{current_time} - Turbo: {is_turbo}, Heavy: {is_heavy_running}, Idle: {is_idle} ({elapsed_time}s), Action: {desired_plan}"
+                    log_msg = f"{current_time} - Turbo: {is_turbo}, Heavy: {is_heavy_running}, Idle: {is_idle} ({elapsed_time}s), Power: {power_source}, Action: {desired_plan}"
                     self.write_to_activity_log(log_msg)
+
+                    if self.memory_diagnostics:
+                        self.memory_diagnostics.maybe_report()
                     
                     time.sleep(self.check_interval)
                     
@@ -148,6 +179,8 @@ class PowerController:
         finally:
             logger.info("Stopping Smart Power Manager...")
             self.activity_monitor.stop_monitoring()
+            if self.memory_diagnostics:
+                self.memory_diagnostics.stop()
             if self.power_manager and self.power_manager._is_admin():
                 logger.debug(f"[DEBUG] Attempting to restore power plan. _previous_manual_power_plan: {self._previous_manual_power_plan}")
                 if self._previous_manual_power_plan:
@@ -0,0 +1,130 @@
+import time
+import logging
+from utils.logger import setup_logger
+
+logger = setup_logger('power_source_monitor', logging.DEBUG)
+
+PLAN_ORDER = ['power_saver', 'balanced', 'high_performance', 'turbo']
+
+
+class PowerSourceState:
+    __slots__ = ('on_ac', 'percent', 'secs_left', 'has_battery')
+
+    def __init__(self, on_ac, percent, secs_left, has_battery):
+        self.on_ac = on_ac
+        self.percent = percent
+        self.secs_left = secs_left
+        self.has_battery = has_battery
+
+    def describe(self):
+        if not self.has_battery:
+            return "AC (no battery)"
+        source = "AC" if self.on_ac else "Battery"
+        minutes_left = f", {self.secs_left // 60}min left" if self.secs_left is not None else ""
+        return f"{source} {self.percent:.0f}%{minutes_left}"
+
+
+NO_BATTERY_STATE = PowerSourceState(True, None, None, False)
+
+
+class PowerSourceMonitor:
+    def __init__(self, settings=None, sensor_source=None):
+        if sensor_source is None:
+            import psutil
+            sensor_source = psutil.sensors_battery
+        self.sensor_source = sensor_source
+
+        def getint(option, fallback):
+            return settings.getint('PowerSource', option, fallback=fallback) if settings else fallback
+
+        self.allow_turbo_on_battery = settings.getboolean('PowerSource', 'allow_turbo_on_battery', fallback=False) if settings else False
+
+        self.ac_sample_interval = getint('ac_sample_interval_seconds', 120)
+        self.battery_sample_interval = getint('battery_sample_interval_seconds', 30)
+        self.low_battery_sample_interval = getint('low_battery_sample_interval_seconds', 10)
+        self.low_battery_percent = getint('low_battery_percent', 20)
+        self.turbo_min_battery_percent = getint('turbo_min_battery_percent', 60)
+        self.high_performance_min_battery_percent = getint('high_performance_min_battery_percent', 30)
+        self.power_saver_below_percent = getint('power_saver_below_percent', 10)
+        self.turbo_min_minutes_left = getint('turbo_min_minutes_left', 0)
+
+        self._state = NO_BATTERY_STATE
+        self._last_sample_time = None
+        self._last_capped = None
+
+        logger.info(f"PowerSourceMonitor initialized: sampling every {self.ac_sample_interval}s on AC, "
+                    f"{self.battery_sample_interval}s on battery, {self.low_battery_sample_interval}s below {self.low_battery_percent}%")
+        turbo_cap = f"{self.turbo_min_battery_percent}%" if self.allow_turbo_on_battery else "never"
+        logger.info(f"Battery caps: turbo >= {turbo_cap}, "
+                    f"high_performance >= {self.high_performance_min_battery_percent}%, "
+                    f"power_saver below {self.power_saver_below_percent}%")
+
+    def _sample_interval(self):
+        state = self._state
+        if state.on_ac:
+            return self.ac_sample_interval
+        if state.percent is not None and state.percent <= self.low_battery_percent:
+            return self.low_battery_sample_interval
+        return self.battery_sample_interval
+
+    def _read_sensor(self):
+        battery = self.sensor_source()
+        if battery is None:
+            return NO_BATTERY_STATE
+
+        secs_left = battery.secsleft
+        if secs_left is None or secs_left < 0:
+            secs_left = None
+        # power_plugged is None when the OS cannot tell; do not restrict plans in that case
+        on_ac = battery.power_plugged is not False
+        return PowerSourceState(on_ac, float(battery.percent), secs_left, True)
+
+    def get_state(self):
+        now = time.time()
+        if self._last_sample_time is not None and now - self._last_sample_time < self._sample_interval():
+            return self._state
+
+        self._last_sample_time = now
+        try:
+            state = self._read_sensor()
+        except Exception as e:
+            logger.error(f"Error reading battery sensor: {e}")
+            return self._state
+
+        if state.on_ac != self._state.on_ac:
+            logger.info(f"Power source changed: {state.describe()}")
+        self._state = state
+        return state
+
+    def _max_allowed_plan(self, state):
+        if state.on_ac or state.percent is None:
+            return 'turbo', None
+
+        percent = state.percent
+        if percent < self.power_saver_below_percent:
+            return 'power_saver', f"battery {percent:.0f}% < {self.power_saver_below_percent}%"
+        if percent < self.high_performance_min_battery_percent:
+            return 'balanced', f"battery {percent:.0f}% < {self.high_performance_min_battery_percent}%"
+        if not self.allow_turbo_on_battery:
+            return 'high_performance', "turbo disabled on battery"
+        if percent < self.turbo_min_battery_percent:
+            return 'high_performance', f"battery {percent:.0f}% < {self.turbo_min_battery_percent}%"
+        if self.turbo_min_minutes_left and state.secs_left is not None and \
+           state.secs_left < self.turbo_min_minutes_left * 60:
+            return 'high_performance', f"{state.secs_left // 60}min left < {self.turbo_min_minutes_left}min"
+        return 'turbo', None
+
+    def apply_policy(self, desired_plan, state=None):
+        if state is None:
+            state = self.get_state()
+
+        max_plan, reason = self._max_allowed_plan(state)
+        if desired_plan not in PLAN_ORDER or PLAN_ORDER.index(desired_plan) <= PLAN_ORDER.index(max_plan):
+            self._last_capped = None
+            return desired_plan, None
+
+        capped = (desired_plan, max_plan)
+        if capped != self._last_capped:
+            logger.info(f"Battery policy: {desired_plan} capped to {max_plan} ({reason})")
+            self._last_capped = capped
+        return max_plan, reason
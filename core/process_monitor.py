@@ -4,17 +4,33 @@ import win32gui
 import win32process
 import win32con
 import time
+import sys
 from utils.logger import setup_logger
 
 logger = setup_logger('process_monitor', logging.DEBUG)
 
+BACKGROUND_NAME_MARKERS = ("svchost", "runtime", "broker", "service", "helper", "system")
+
+
+class ProcessEntry:
+    __slots__ = ('name', 'pid', 'timestamp', 'has_window')
+
+    def __init__(self, name, pid, timestamp, has_window):
+        self.name = name
+        self.pid = pid
+        self.timestamp = timestamp
+        self.has_window = has_window
+
+
 class ProcessMonitor:
     def __init__(self, heavy_process_names, turbo_config=None):
-        self.heavy_process_names = {name.lower() for name in heavy_process_names}
+        self.heavy_process_names = {sys.intern(name.lower()) for name in heavy_process_names}
         
         self.min_apps_threshold = turbo_config.getint('TurboMode', 'min_apps_threshold', fallback=2) if turbo_config else 2
-        self.turbo_apps = {name.strip().lower() for name in turbo_config.get('TurboMode', 'turbo_apps', fallback='').split(',') if name.strip()} if turbo_config else set()
+        self.turbo_apps = {sys.intern(name.strip().lower()) for name in turbo_config.get('TurboMode', 'turbo_apps', fallback='').split(',') if name.strip()} if turbo_config else set()
         
+        self._configured_names = {name: name for name in self.heavy_process_names | self.turbo_apps}
+
         logger.info("=== ProcessMonitor Initialization ===")
         logger.info(f"Heavy processes configured: {self.heavy_process_names}")
         logger.info(f"Turbo mode threshold: {self.min_apps_threshold} apps")
@@ -23,6 +39,7 @@ class ProcessMonitor:
         
         self._cache_lifetime = 2.0  
         self._window_cache = {}  
+        self._expired_pids = []
         self._last_active_processes = set()
         self._last_turbo_state = (False, set())
         self._last_heavy_state = False
@@ -30,24 +47,31 @@ class ProcessMonitor:
         self._skipped_processes_count = 0
 
     def _get_cached_window_state(self, proc_name, pid):
-        cache_key = (proc_name, pid)
-        if cache_key in self._window_cache:
-            timestamp, has_window = self._window_cache[cache_key]
-            if time.time() - timestamp < self._cache_lifetime:
-                return has_window
+        entry = self._window_cache.get(pid)
+        if entry is not None and entry.name == proc_name:
+            if time.time() - entry.timestamp < self._cache_lifetime:
+                return entry.has_window
         return None
 
     def _update_window_cache(self, proc_name, pid, has_window):
-        self._window_cache[(proc_name, pid)] = (time.time(), has_window)
+        now = time.time()
+        entry = self._window_cache.get(pid)
+        if entry is None:
+            self._window_cache[pid] = ProcessEntry(proc_name, pid, now, has_window)
+        else:
+            entry.name = proc_name
+            entry.timestamp = now
+            entry.has_window = has_window
 
     def _cleanup_cache(self):
         now = time.time()
-        expired = []
-        for key, (timestamp, _) in self._window_cache.items():
-            if now - timestamp >= self._cache_lifetime:
-                expired.append(key)
-        for key in expired:
-            del self._window_cache[key]
+        expired = self._expired_pids
+        for pid, entry in self._window_cache.items():
+            if now - entry.timestamp >= self._cache_lifetime:
+                expired.append(pid)
+        for pid in expired:
+            del self._window_cache[pid]
+        expired.clear()
 
     def has_visible_window(self, proc_name, pid):
         def callback(hwnd, hwnds):
@@ -71,12 +95,14 @@ class ProcessMonitor:
                             if width <= 50 or height <= 50:
                                 return True
                             
-                            hwnds.append((hwnd, title, width, height))
+                            hwnds.append(hwnd)
+                            return False
                             
                         except Exception as e:
                             logger.debug(f"Error checking window style - Process: {proc_name}, Error: {e}")
                             if title == "Program Manager" or (width > 50 and height > 50):
-                                hwnds.append((hwnd, title, width, height))
+                                hwnds.append(hwnd)
+                                return False
                                 
             except Exception as e:
                 logger.debug(f"Error checking window - HWND: {hwnd}, Error: {e}")
@@ -85,31 +111,34 @@ class ProcessMonitor:
         hwnds = []
         try:
             win32gui.EnumWindows(callback, hwnds)
-            if hwnds:
-                logger.debug(f"Found {len(hwnds)} valid windows for {proc_name}")
-                return True
-            return False
         except Exception as e:
-            logger.error(f"Error enumerating windows for {proc_name}: {e}")
-            return False
+            # Stopping the enumeration early makes EnumWindows report failure on some pywin32 versions
+            if not hwnds:
+                logger.error(f"Error enumerating windows for {proc_name}: {e}")
+                return False
+        if hwnds:
+            logger.debug(f"Found valid window {hwnds[0]} for {proc_name}")
+            return True
+        return False
 
     def get_active_processes_with_windows(self):
         current_time = time.time()
         if current_time - self._last_check_time < self._cache_lifetime:
             return self._last_active_processes
 
-        self._last_check_time = current_time
         self._cleanup_cache()
         
-        active_processes = set()
+        active_processes = self._last_active_processes
+        active_processes.clear()
         self._skipped_processes_count = 0
         
         for process in psutil.process_iter(['name', 'pid']):
             try:
-                proc_name = process.info.get('name', '').lower()
+                proc_name = (process.info.get('name') or '').lower()
+                proc_name = self._configured_names.get(proc_name, proc_name)
                 proc_pid = process.info.get('pid', 0)
                 
-                if any(x in proc_name for x in ["svchost", "runtime", "broker", "service", "helper", "system"]):
+                if any(x in proc_name for x in BACKGROUND_NAME_MARKERS):
                     self._skipped_processes_count += 1
                     continue
                 
@@ -130,7 +159,8 @@ class ProcessMonitor:
 
         logger.debug(f"Process scan complete: {len(active_processes)} active, {self._skipped_processes_count} background skipped")
         
-        self._last_active_processes = active_processes
+        # Only a completed scan is served from cache; an interrupted one is retried on the next call
+        self._last_check_time = current_time
         return active_processes
 
     def check_turbo_condition(self):
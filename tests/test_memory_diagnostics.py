@@ -0,0 +1,93 @@
+import importlib
+import tracemalloc
+
+import pytest
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def diagnostics(tmp_path, monkeypatch):
+    # setup_logger opens details_debug.txt in the working directory on first import
+    monkeypatch.chdir(tmp_path)
+    module = importlib.import_module('utils.memory_diagnostics')
+    monkeypatch.setattr(module, 'time', FakeClock())
+    if tracemalloc.is_tracing():
+        pytest.skip("tracemalloc is already tracing in this session")
+    yield module
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+
+@pytest.fixture
+def stop_calls(monkeypatch):
+    calls = []
+    real_stop = tracemalloc.stop
+
+    def counting_stop():
+        calls.append(True)
+        real_stop()
+
+    monkeypatch.setattr(tracemalloc, 'stop', counting_stop)
+    return calls
+
+
+def test_maybe_report_waits_for_interval(diagnostics):
+    monitor = diagnostics.MemoryDiagnostics(interval_seconds=600, top_n=3)
+    monitor.start()
+
+    diagnostics.time.now += 599
+    assert monitor.maybe_report() is None
+
+    diagnostics.time.now += 1
+    report = monitor.maybe_report()
+    assert isinstance(report, dict)
+    assert len(report['top']) <= 3
+    assert report['elapsed_hours'] == pytest.approx(600 / 3600)
+
+    assert monitor.maybe_report() is None
+    monitor.stop()
+
+
+def test_maybe_report_before_start_returns_none(diagnostics):
+    monitor = diagnostics.MemoryDiagnostics(interval_seconds=0)
+    assert monitor.maybe_report() is None
+
+
+def test_stop_ends_tracing_it_started(diagnostics, stop_calls):
+    monitor = diagnostics.MemoryDiagnostics()
+    monitor.start()
+    assert tracemalloc.is_tracing()
+
+    monitor.stop()
+    assert stop_calls == [True]
+    assert not tracemalloc.is_tracing()
+
+
+def test_stop_leaves_existing_tracing_running(diagnostics, stop_calls):
+    tracemalloc.start()
+    monitor = diagnostics.MemoryDiagnostics()
+    monitor.start()
+
+    monitor.stop()
+    assert stop_calls == []
+    assert tracemalloc.is_tracing()
+
+
+def test_growth_is_positive_after_retained_allocation(diagnostics):
+    monitor = diagnostics.MemoryDiagnostics(interval_seconds=3600)
+    monitor.start()
+
+    retained = [bytearray(1024) for _ in range(256)]
+    diagnostics.time.now += 3600
+    report = monitor.maybe_report()
+
+    assert report['growth_bytes_per_hour'] > 256 * 1024
+    assert retained
+    monitor.stop()
@@ -0,0 +1,142 @@
+import collections
+import importlib
+import configparser
+
+import pytest
+
+sbattery = collections.namedtuple('sbattery', ['percent', 'secsleft', 'power_plugged'])
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+
+class FakeSensor:
+    def __init__(self, reading=None):
+        self.reading = reading
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if isinstance(self.reading, Exception):
+            raise self.reading
+        return self.reading
+
+
+@pytest.fixture
+def clock(tmp_path, monkeypatch):
+    # setup_logger opens details_debug.txt in the working directory on first import
+    monkeypatch.chdir(tmp_path)
+    module = importlib.import_module('core.power_source_monitor')
+    fake_clock = FakeClock()
+    monkeypatch.setattr(module, 'time', fake_clock)
+    return fake_clock
+
+
+def make_monitor(reading, **options):
+    from core.power_source_monitor import PowerSourceMonitor
+    settings = configparser.ConfigParser()
+    settings['PowerSource'] = {key: str(value) for key, value in options.items()}
+    sensor = FakeSensor(reading)
+    return PowerSourceMonitor(settings, sensor_source=sensor), sensor
+
+
+def on_battery(percent, secsleft=7200):
+    return sbattery(percent, secsleft, False)
+
+
+@pytest.mark.parametrize('percent, expected', [(9.9, 'power_saver'), (10, 'balanced')])
+def test_power_saver_below_percent_boundary(clock, percent, expected):
+    monitor, _ = make_monitor(on_battery(percent), power_saver_below_percent=10)
+    assert monitor.apply_policy('balanced')[0] == expected
+
+
+@pytest.mark.parametrize('percent, expected', [(29, 'balanced'), (30, 'high_performance')])
+def test_high_performance_min_battery_percent_boundary(clock, percent, expected):
+    monitor, _ = make_monitor(on_battery(percent), high_performance_min_battery_percent=30)
+    assert monitor.apply_policy('high_performance')[0] == expected
+
+
+@pytest.mark.parametrize('percent, expected', [(59, 'high_performance'), (60, 'turbo')])
+def test_turbo_min_battery_percent_boundary(clock, percent, expected):
+    monitor, _ = make_monitor(on_battery(percent), allow_turbo_on_battery=1, turbo_min_battery_percent=60)
+    assert monitor.apply_policy('turbo')[0] == expected
+
+
+@pytest.mark.parametrize('secsleft, expected', [(1799, 'high_performance'), (1800, 'turbo')])
+def test_turbo_min_minutes_left_boundary(clock, secsleft, expected):
+    monitor, _ = make_monitor(on_battery(90, secsleft), allow_turbo_on_battery=1, turbo_min_minutes_left=30)
+    assert monitor.apply_policy('turbo')[0] == expected
+
+
+def test_turbo_disabled_on_battery_by_default(clock):
+    monitor, _ = make_monitor(on_battery(100))
+    plan, reason = monitor.apply_policy('turbo')
+    assert plan == 'high_performance'
+    assert reason == "turbo disabled on battery"
+
+
+def test_lower_plans_are_not_raised(clock):
+    monitor, _ = make_monitor(on_battery(50))
+    assert monitor.apply_policy('power_saver') == ('power_saver', None)
+
+
+def test_unknown_plug_state_is_not_restricted(clock):
+    monitor, _ = make_monitor(sbattery(5, -1, None))
+    state = monitor.get_state()
+    assert state.on_ac
+    assert state.secs_left is None
+    assert monitor.apply_policy('turbo', state) == ('turbo', None)
+
+
+def test_no_battery_is_treated_as_ac(clock):
+    monitor, _ = make_monitor(None)
+    state = monitor.get_state()
+    assert not state.has_battery
+    assert state.describe() == "AC (no battery)"
+    assert monitor.apply_policy('turbo', state) == ('turbo', None)
+    assert monitor._sample_interval() == 120
+
+
+def test_sampling_interval_switches_from_ac_to_low_battery(clock):
+    monitor, sensor = make_monitor(sbattery(80, -2, True), low_battery_percent=20)
+    monitor.get_state()
+    assert sensor.calls == 1
+
+    sensor.reading = on_battery(20)
+    clock.now += 119
+    assert monitor.get_state().on_ac
+    assert sensor.calls == 1
+
+    clock.now += 1
+    assert not monitor.get_state().on_ac
+    assert sensor.calls == 2
+    assert monitor._sample_interval() == 10
+
+    clock.now += 9
+    monitor.get_state()
+    assert sensor.calls == 2
+    clock.now += 1
+    monitor.get_state()
+    assert sensor.calls == 3
+
+
+def test_battery_above_low_threshold_uses_battery_interval(clock):
+    monitor, _ = make_monitor(on_battery(21), low_battery_percent=20)
+    monitor.get_state()
+    assert monitor._sample_interval() == 30
+
+
+def test_sensor_error_keeps_previous_reading(clock):
+    monitor, sensor = make_monitor(on_battery(50))
+    assert monitor.get_state().percent == 50
+
+    sensor.reading = OSError("sensor unavailable")
+    clock.now += 30
+    state = monitor.get_state()
+    assert sensor.calls == 2
+    assert state.percent == 50
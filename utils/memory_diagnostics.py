@@ -0,0 +1,80 @@
+import time
+import logging
+import tracemalloc
+from utils.logger import setup_logger
+
+logger = setup_logger('memory_diagnostics', logging.DEBUG)
+
+class MemoryDiagnostics:
+    def __init__(self, interval_seconds=600, top_n=10, frames=1):
+        self.interval_seconds = interval_seconds
+        self.top_n = top_n
+        self.frames = frames
+        self._baseline = None
+        self._baseline_time = None
+        self._last_snapshot_time = 0
+        self._started_tracing = False
+        logger.info(f"MemoryDiagnostics initialized: every {interval_seconds}s, top {top_n} sites, {frames} frame(s)")
+
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started_tracing = True
+        self._baseline = self._take_snapshot()
+        self._baseline_time = time.time()
+        self._last_snapshot_time = self._baseline_time
+        logger.info("tracemalloc diagnostics started")
+
+    def stop(self):
+        if self._baseline is not None:
+            self.report()
+        self._baseline = None
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        logger.info("tracemalloc diagnostics stopped")
+
+    def maybe_report(self):
+        if self._baseline is None:
+            return None
+        if time.time() - self._last_snapshot_time < self.interval_seconds:
+            return None
+        return self.report()
+
+    def _take_snapshot(self):
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<unknown>"),
+        ))
+
+    def report(self):
+        now = time.time()
+        snapshot = self._take_snapshot()
+        self._last_snapshot_time = now
+
+        elapsed_hours = max(now - self._baseline_time, 1.0) / 3600.0
+        current, peak = tracemalloc.get_traced_memory()
+        top_stats = snapshot.statistics('lineno')[:self.top_n]
+        diff_stats = snapshot.compare_to(self._baseline, 'lineno')
+        growth_stats = [stat for stat in diff_stats if stat.size_diff > 0][:self.top_n]
+        total_growth = sum(stat.size_diff for stat in diff_stats)
+
+        logger.info(f"Memory: current {current / 1024:.1f} KiB, peak {peak / 1024:.1f} KiB, "
+                    f"growth {total_growth / 1024 / elapsed_hours:+.1f} KiB/h over {elapsed_hours:.2f}h")
+        for index, stat in enumerate(top_stats, 1):
+            frame = stat.traceback[0]
+            logger.info(f"  Top #{index}: {frame.filename}:{frame.lineno} - {stat.size / 1024:.1f} KiB in {stat.count} blocks")
+        for index, stat in enumerate(growth_stats, 1):
+            frame = stat.traceback[0]
+            logger.info(f"  Growth #{index}: {frame.filename}:{frame.lineno} - "
+                        f"{stat.size_diff / 1024 / elapsed_hours:+.1f} KiB/h ({stat.count_diff:+d} blocks)")
+
+        return {
+            'current_bytes': current,
+            'peak_bytes': peak,
+            'elapsed_hours': elapsed_hours,
+            'growth_bytes_per_hour': total_growth / elapsed_hours,
+            'top': [(str(stat.traceback[0]), stat.size, stat.count) for stat in top_stats],
+            'growth': [(str(stat.traceback[0]), stat.size_diff / elapsed_hours, stat.count_diff) for stat in growth_stats],
+        }